@@ -7,13 +7,16 @@ from .column import Column
 from .types import formula, NativeTypes
 
 
-def load_workbook(filename: str | Path) -> Workbook:
-    """Load an Excel workbook from file.
+def load_workbook(filename: str | Path | bytes | bytearray | memoryview, read_only: bool = False) -> Workbook:
+    """Load an Excel workbook from file or from its contents in memory.
     
     Args:
-        filename: Path to the XLSX file
+        filename: Path to the XLSX file, or the file's contents as bytes, bytearray or memoryview
+        read_only: Load values only; the workbook cannot be edited
         
     Returns:
         Workbook object for surgical editing
     """
-    return Workbook(Path(filename))
+    if isinstance(filename, (bytes, bytearray, memoryview)):
+        return Workbook(bytes(filename), read_only=read_only)
+    return Workbook(Path(filename), read_only=read_only)
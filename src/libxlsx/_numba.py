@@ -0,0 +1,58 @@
+"""Numba-compiled helpers for very large sheets.
+
+Only imported when numba and numpy are installed; see utils.parse_cell_refs.
+"""
+from __future__ import annotations
+import numba
+import numpy as np
+
+
+# Longest column (XFD) and row number (1048576) Excel allows
+MAX_LETTERS = 3
+MAX_DIGITS = 7
+
+
+@numba.njit(cache=True)
+def _parse_refs_kernel(buf, offsets, out_col, out_row):
+    """Parse concatenated ASCII cell refs into 0-based columns and rows.
+    
+    Refs that are not uppercase letters followed by digits get column -1,
+    as do refs longer than MAX_LETTERS letters or MAX_DIGITS digits, so
+    the int64 accumulators can never wrap; those take the Python path.
+    """
+    for k in range(len(offsets) - 1):
+        i = offsets[k]
+        end = offsets[k + 1]
+        col = 0
+        while i < end and 65 <= buf[i] <= 90:
+            col = col * 26 + buf[i] - 64
+            i += 1
+        
+        row = 0
+        letters = i - offsets[k]
+        if col == 0 or i == end or letters > MAX_LETTERS or end - i > MAX_DIGITS:
+            out_col[k] = -1
+            continue
+        while i < end:
+            digit = buf[i] - 48
+            if digit < 0 or digit > 9:
+                col = 0
+                break
+            row = row * 10 + digit
+            i += 1
+        
+        out_col[k] = col - 1
+        out_row[k] = row
+
+
+def parse_cell_refs(cell_refs: list[str]) -> tuple[list[int], list[int]]:
+    """Parse a batch of cell refs into column indices and rows in one compiled pass."""
+    encoded = [ref.encode('ascii', 'replace') for ref in cell_refs]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(ref) for ref in encoded], out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    
+    cols = np.empty(len(encoded), dtype=np.int64)
+    rows = np.empty(len(encoded), dtype=np.int64)
+    _parse_refs_kernel(buf, offsets, cols, rows)
+    return cols.tolist(), rows.tolist()
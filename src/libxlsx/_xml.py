@@ -0,0 +1,75 @@
+"""XML backend selection.
+
+CPython uses lxml everywhere. PyPy cannot JIT through lxml's C extension and
+its expat-backed ``xml.etree`` is faster there, so read paths use the stdlib
+instead. Editing keeps needing lxml's tree API (parent links, sibling
+insertion, prefix-preserving serialization), so lxml stays a dependency.
+"""
+from __future__ import annotations
+import functools
+import platform
+import re
+from typing import IO, Any, Callable, Iterator
+
+if platform.python_implementation() == 'PyPy':
+    from xml.etree import ElementTree as etree
+    LXML = False
+else:
+    from lxml import etree
+    LXML = True
+
+
+@functools.cache
+def editing_etree() -> Any:
+    """Get lxml, which editable sheets need to modify their XML in place."""
+    from lxml import etree as lxml_etree
+    return lxml_etree
+
+
+def XPath(path: str, namespaces: dict[str, str]) -> Callable[..., list[Any]]:
+    """Compile an XPath expression for the active backend.
+    
+    Under the stdlib only the ElementPath subset is available: descendant
+    (//) and child steps, and [@attr=$var] predicates bound at call time.
+    """
+    if LXML:
+        return etree.XPath(path, namespaces=namespaces)
+    
+    if path.startswith('//'):
+        path = '.' + path
+    elif path.startswith('/'):
+        raise ValueError(f"Absolute XPath is not supported by the stdlib backend: {path}")
+    
+    def evaluate(root: Any, **variables: str) -> list[Any]:
+        query = path
+        if variables:
+            # Inline variables as quoted literals, which ElementPath accepts
+            query = re.sub(r'\$(\w+)', lambda m: repr(str(variables[m.group(1)])), query)
+        return root.findall(query, namespaces)
+    
+    return evaluate
+
+
+def iterparse(source: IO[bytes], tag: str | tuple[str, ...]) -> Iterator[Any]:
+    """Yield elements with the given tag(s) as their end tags are parsed."""
+    if LXML:
+        for _, elem in etree.iterparse(source, events=('end',), tag=tag):
+            yield elem
+        return
+    
+    tags = {tag} if isinstance(tag, str) else set(tag)
+    for _, elem in etree.iterparse(source, events=('end',)):
+        if elem.tag in tags:
+            yield elem
+
+
+def release(elem: Any) -> None:
+    """Free a fully processed element from an iterparse tree."""
+    if LXML:
+        elem.clear(keep_tail=True)
+        # Also drop earlier siblings, which clear() leaves attached
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    else:
+        # Stdlib elements have no parent link; the emptied shell stays behind
+        elem.clear()
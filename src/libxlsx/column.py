@@ -1,8 +1,12 @@
 from __future__ import annotations
-from typing import Iterator, TYPE_CHECKING
-from .types import NativeTypes
+import bisect
+from itertools import repeat
+from typing import Iterator, Mapping, TYPE_CHECKING
+from .types import NativeTypes, TAG_BY_TYPE, TYPE_BY_TAG, ValueTag
+from .utils import intern_column
 
 if TYPE_CHECKING:
+    import numpy
     from .sheet import Sheet
 
 
@@ -17,7 +21,7 @@ class Column:
             column: Column letter (A, B, C, etc.)
         """
         self.sheet = sheet
-        self.column = column
+        self.column = intern_column(column)
     
     def __getitem__(self, row: int | slice) -> NativeTypes | Iterator[NativeTypes]:
         """Get value(s) from specific row(s).
@@ -44,21 +48,98 @@ class Column:
             if stop is not None and stop < start:
                 raise ValueError("Slice stop must be >= start")
             
-            def row_iterator() -> Iterator[NativeTypes]:
-                current = start
-                while stop is None or current < stop:
-                    value = self.sheet.get_cell_value(self.column, current)
-                    if value is None and stop is None:
-                        # Stop iteration when we hit empty cells in open-ended slice
-                        break
-                    yield value
-                    current += 1
-            
-            return row_iterator()
+            return iter(self.values(start, stop))
         
         else:
             raise TypeError(f"Row index must be int or slice, got {type(row)}")
     
+    def values(self, start: int = 1, stop: int | None = None) -> list[NativeTypes]:
+        """Get the values of a row range as a list in one pass.
+        
+        Args:
+            start: First row (1-based)
+            stop: Row to stop before; None reads until the first empty cell
+            
+        Returns:
+            Values in row order, with None for empty cells in a bounded range
+        """
+        cells = self.sheet._cells
+        column = self.column
+        if stop is not None:
+            # zip hands dict.get the same key tuple each time and map fills
+            # the list in C, faster than the equivalent comprehension
+            return list(map(cells.get, zip(repeat(column), range(start, stop))))
+        
+        # Open-ended: read up to the first missing row or empty value
+        rows = self.sheet._col_rows.get(column, ())
+        pos = bisect.bisect_left(rows, start)
+        if pos == len(rows) or rows[pos] != start:
+            return []
+        
+        # Rows are sorted and unique, so rows[i] - i is non-decreasing and
+        # stays constant exactly while rows are consecutive; bisect for the gap
+        offset = start - pos
+        end = bisect.bisect_right(range(pos, len(rows)), offset, key=lambda i: rows[i] - i) + pos
+        
+        # Cells present but empty also end the range; array.index scans in C
+        try:
+            end = self.sheet._col_tags[column].index(ValueTag.EMPTY, pos, end)
+        except ValueError:
+            pass
+        return list(map(cells.get, zip(repeat(column), range(start, start + end - pos))))
+    
+    def to_list(self) -> list[NativeTypes]:
+        """Get all non-empty values in the column, in row order."""
+        cells = self.sheet._cells
+        column = self.column
+        values = list(map(cells.get, zip(repeat(column), self.sheet._col_rows.get(column, ()))))
+        if ValueTag.EMPTY in self.sheet._col_tags.get(column, ()):
+            return [value for value in values if value is not None]
+        return values
+    
+    def to_numpy(self) -> numpy.ndarray | None:
+        """Get all non-empty values as a NumPy array, for purely numeric columns.
+        
+        Requires numpy (included in the fast extra). The stored type tags
+        decide the dtype up front, so no value is inspected twice.
+        
+        Returns:
+            int64 array when every value is an int, float64 when values are
+            floats or a mix of floats and ints, or None if any value is not
+            a number (bools included)
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("Column.to_numpy requires numpy; install it or the fast extra") from None
+        
+        tags = self.sheet._col_tags.get(self.column, ())
+        ints = tags.count(ValueTag.INT)
+        floats = tags.count(ValueTag.FLOAT)
+        empty = tags.count(ValueTag.EMPTY)
+        if ints + floats + empty != len(tags):
+            return None
+        
+        dtype = np.int64 if ints and not floats else np.float64
+        return np.array(self.to_list(), dtype=dtype)
+    
+    def rows_of_type(self, value_type: type) -> list[int]:
+        """Get the rows whose value has exactly the given type.
+        
+        Args:
+            value_type: float, int, str, bool or formula; str excludes formulas
+            
+        Returns:
+            Matching row numbers in order
+        """
+        tag = TAG_BY_TYPE.get(value_type)
+        if tag is None:
+            raise TypeError(f"Unsupported cell value type: {value_type}")
+        
+        rows = self.sheet._col_rows.get(self.column, ())
+        tags = self.sheet._col_tags.get(self.column, ())
+        return [row for row, row_tag in zip(rows, tags) if row_tag == tag]
+    
     def __setitem__(self, row: int, value: NativeTypes) -> None:
         """Set value at specific row.
         
@@ -71,29 +152,52 @@ class Column:
         
         self.sheet.set_cell_value(self.column, row, value)
     
+    def partition_by_type(self, start: int = 1, stop: int | None = None) -> dict[type, list[tuple[int, NativeTypes]]]:
+        """Group the values of a row range by exact type in one pass.
+        
+        Args:
+            start: First row (1-based)
+            stop: Row to stop before; None reads to the last row
+            
+        Returns:
+            (row, value) pairs in row order for each of float, int, str,
+            bool and formula; as in rows_of_type, bools are not ints and
+            formulas are not strs
+        """
+        groups: dict[type, list[tuple[int, NativeTypes]]] = {value_type: [] for value_type in TYPE_BY_TAG.values()}
+        by_tag = {tag: groups[value_type] for tag, value_type in TYPE_BY_TAG.items()}
+        
+        rows = self.sheet._col_rows.get(self.column, ())
+        tags = self.sheet._col_tags.get(self.column, ())
+        lo = bisect.bisect_left(rows, start)
+        hi = len(rows) if stop is None else bisect.bisect_left(rows, stop)
+        
+        # The stored tags pick each group without an isinstance check per value
+        cells = self.sheet._cells
+        column = self.column
+        for pos in range(lo, hi):
+            group = by_tag.get(tags[pos])
+            if group is not None:
+                row = rows[pos]
+                group.append((row, cells[(column, row)]))
+        return groups
+    
+    def update(self, values: Mapping[int, NativeTypes]) -> None:
+        """Set many rows of the column in one call.
+        
+        Args:
+            values: Mapping of row number (1-based) to value
+        """
+        column = self.column
+        self.sheet.update({(column, row): value for row, value in values.items()})
+    
     def __iter__(self) -> Iterator[NativeTypes]:
         """Iterate over all values in the column."""
-        # Find all rows that have data in this column
-        rows_with_data = []
-        for (col, row), value in self.sheet._cells.items():
-            if col == self.column and value is not None:
-                rows_with_data.append(row)
-        
-        if not rows_with_data:
-            return iter([])
-        
-        # Sort rows and iterate from 1 to max row
-        max_row = max(rows_with_data)
-        
-        for row in range(1, max_row + 1):
-            value = self.sheet.get_cell_value(self.column, row)
-            if value is not None:
-                yield value
+        return iter(self.to_list())
     
     def __len__(self) -> int:
         """Get number of non-empty cells in the column."""
-        count = 0
-        for (col, row), value in self.sheet._cells.items():
-            if col == self.column and value is not None:
-                count += 1
-        return count
\ No newline at end of file
+        tags = self.sheet._col_tags.get(self.column)
+        if tags is None:
+            return 0
+        return len(tags) - tags.count(ValueTag.EMPTY)
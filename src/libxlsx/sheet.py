@@ -1,13 +1,38 @@
 from __future__ import annotations
-from typing import Iterator, TYPE_CHECKING
-from lxml import etree
+import bisect
+from array import array
+from itertools import repeat
+from typing import BinaryIO, Iterable, Iterator, Mapping, TYPE_CHECKING
+from ._xml import etree, editing_etree, iterparse, release
 from .column import Column
-from .utils import NAMESPACES, parse_cell_ref, get_cell_value_from_element, CellAttr, RowAttr
+from .types import NativeTypes, TYPE_BY_TAG, value_tag
+from .utils import (
+    TAG_SHEETDATA, TAG_ROW, TAG_C, parse_cell_ref, parse_cell_refs, make_cell_ref,
+    column_to_index, index_to_column, column_range,
+    get_cell_value_from_element, create_cell_element, CellAttr, RowAttr,
+)
 
 if TYPE_CHECKING:
     from .workbook import Workbook
 
 
+# Sheet.update inserts new rows one by one while they are fewer than
+# 1/_INSERT_RATIO of the column, and merges the sorted runs otherwise
+_INSERT_RATIO = 32
+
+
+class _ColumnCache(dict):
+    """Column objects by letter, created on first lookup."""
+    
+    def __init__(self, sheet: Sheet) -> None:
+        super().__init__()
+        self._sheet = sheet
+    
+    def __missing__(self, column: str) -> Column:
+        col = self[column] = Column(self._sheet, column)
+        return col
+
+
 class Sheet:
     """Represents a worksheet with column-based access."""
     
@@ -23,102 +48,307 @@ class Sheet:
         self.worksheet_path = worksheet_path
         self.workbook = workbook
         self._cells: dict[tuple[str, int], str | int | float | bool | None] = {}
-        self._columns: dict[str, Column] = {}
+        self._columns: dict[str, Column] = _ColumnCache(self)
+        self._col_rows: dict[str, list[int]] = {}  # Column -> sorted rows that have a cell
+        self._col_tags: dict[str, array] = {}  # Column -> ValueTag per entry of _col_rows
+        
+        # Parsed worksheet XML, kept alive so writes mutate it in place
+        self._root: etree._Element | None = None
+        self._cell_elems: dict[tuple[str, int], etree._Element] = {}
+        self._row_elems: dict[int, etree._Element] = {}
+        self._row_order: list[int] = []  # Sorted row numbers present in the XML
+        self._row_col_order: dict[int, list[int]] = {}  # Row -> sorted column indices, built on demand
+        self._dirty = False
         
         # Load cell data
         self._load_cells()
     
     def _load_cells(self) -> None:
         """Load all cells from the worksheet XML."""
-        worksheet_xml = self.workbook.get_zip_data(self.worksheet_path)
-        if not worksheet_xml:
+        # Shared strings come first so only one member is being read at a time
+        shared_strings = self.workbook.get_shared_strings()
+        worksheet_file = self.workbook.open_zip_member(self.worksheet_path)
+        if worksheet_file is None:
             return
         
-        root = etree.fromstring(worksheet_xml)
-        shared_strings = self.workbook.get_shared_strings()
+        if self.workbook.read_only:
+            with worksheet_file:
+                self._stream_cells(worksheet_file)
+            return
         
-        # Find all cell elements
-        for cell_elem in root.xpath('//w:c', namespaces=NAMESPACES):
-            cell_ref = cell_elem.get(CellAttr.REFERENCE)
-            if not cell_ref:
-                continue
-            
+        # Editing needs lxml whichever backend reads the rest of the workbook
+        with worksheet_file:
+            self._root = root = editing_etree().parse(worksheet_file).getroot()
+        formulas = self.workbook._formulas
+        
+        # Index row elements by number
+        for row_elem in root.iter(TAG_ROW):
             try:
-                column, row = parse_cell_ref(cell_ref)
-                value = get_cell_value_from_element(cell_elem, shared_strings)
-                self._cells[(column, row)] = value
+                self._row_elems[int(row_elem.get(RowAttr.REFERENCE, ''))] = row_elem
             except ValueError:
+                # Skip rows without an explicit number
+                continue
+        self._row_order = sorted(self._row_elems)
+        
+        # Find all cell elements, then resolve their references in one batch
+        cell_elems = []
+        cell_refs = []
+        for cell_elem in root.iter(TAG_C):
+            cell_ref = cell_elem.get(CellAttr.REFERENCE)
+            if cell_ref:
+                cell_elems.append(cell_elem)
+                cell_refs.append(cell_ref)
+        
+        for cell_elem, key in zip(cell_elems, parse_cell_refs(cell_refs)):
+            if key is None:
                 # Skip invalid cell references
                 continue
+            self._cells[key] = get_cell_value_from_element(cell_elem, shared_strings, formulas)
+            self._cell_elems[key] = cell_elem
+        
+        self._build_col_rows()
+    
+    def _stream_cells(self, worksheet_file: BinaryIO) -> None:
+        """Load cell values without keeping the worksheet XML tree."""
+        shared_strings = self.workbook.get_shared_strings()
+        formulas = self.workbook._formulas
+        
+        # One event per row; its cells are read straight from the finished row
+        cells = self._cells
+        for row_elem in iterparse(worksheet_file, tag=TAG_ROW):
+            for cell_elem in row_elem:
+                cell_ref = cell_elem.get(CellAttr.REFERENCE)
+                if not cell_ref or cell_elem.tag != TAG_C:
+                    continue
+                try:
+                    cells[parse_cell_ref(cell_ref)] = get_cell_value_from_element(cell_elem, shared_strings, formulas)
+                except ValueError:
+                    # Skip invalid cell references
+                    continue
+            
+            # Free rows we are done with so memory stays bounded by one row
+            release(row_elem)
+        
+        self._build_col_rows()
+    
+    def _build_col_rows(self) -> None:
+        """Index the loaded cells by column, with a type tag per row."""
+        col_rows = self._col_rows
+        for column, row in self._cells:
+            rows = col_rows.get(column)
+            if rows is None:
+                rows = col_rows[column] = []
+            rows.append(row)
+        
+        cells = self._cells
+        for column, rows in col_rows.items():
+            # Cells arrive in document order, so this is usually already sorted
+            rows.sort()
+            # array() copies a list in one step but appends an iterator's items one by one
+            self._col_tags[column] = array('b', list(map(value_tag, map(cells.get, zip(repeat(column), rows)))))
     
     def get_cell_value(self, column: str, row: int) -> str | int | float | bool | None:
         """Get value of a specific cell."""
         return self._cells.get((column, row))
     
+    def get_many(self, cells: Iterable[tuple[str, int]]) -> list[NativeTypes | None]:
+        """Get the values of many cells in one call.
+        
+        Args:
+            cells: (column, row) pairs, e.g. [(A, 1), (B, 2)]
+            
+        Returns:
+            Values in the order given, with None for empty cells
+        """
+        return list(map(self._cells.get, cells))
+    
+    def get_block(self, columns: tuple[str, str], rows: tuple[int, int]) -> list[list[NativeTypes | None]]:
+        """Get the values of a rectangular range, one list per column.
+        
+        Args:
+            columns: First and last column, inclusive like sheet[A:C]
+            rows: First row and the row to stop before, like column[1:4]
+            
+        Returns:
+            A list of row values for each column, with None for empty cells
+        """
+        start, stop = rows
+        if start < 1:
+            raise ValueError("Row numbers must be 1-based (>= 1)")
+        if stop < start:
+            raise ValueError("Row range stop must be >= start")
+        
+        get = self._cells.get
+        row_range = range(start, stop)
+        return [list(map(get, zip(repeat(column), row_range))) for column in column_range(*columns)]
+    
+    def partition_range(self, columns: tuple[str, str], rows: tuple[int, int]) -> dict[type, list[tuple[str, NativeTypes]]]:
+        """Group the values of a rectangular range by exact type.
+        
+        Args:
+            columns: First and last column, inclusive like sheet[A:C]
+            rows: First row and the row to stop before, like column[1:4]
+            
+        Returns:
+            (cell reference, value) pairs in column-major order for each of
+            float, int, str, bool and formula, as in Column.partition_by_type
+        """
+        start, stop = rows
+        if start < 1:
+            raise ValueError("Row numbers must be 1-based (>= 1)")
+        if stop < start:
+            raise ValueError("Row range stop must be >= start")
+        
+        groups: dict[type, list[tuple[str, NativeTypes]]] = {value_type: [] for value_type in TYPE_BY_TAG.values()}
+        for column in column_range(*columns):
+            for value_type, pairs in self._columns[column].partition_by_type(start, stop).items():
+                groups[value_type].extend([(make_cell_ref(column, row), value) for row, value in pairs])
+        return groups
+    
     def set_cell_value(self, column: str, row: int, value: str | int | float | bool) -> None:
         """Set value of a specific cell."""
+        if self.workbook.read_only:
+            raise ValueError(f"Cannot modify sheet '{self.name}' of a read-only workbook")
+        
+        # Reject invalid columns before any state changes
+        column_to_index(column)
+        
         # Store the value
+        rows = self._col_rows.setdefault(column, [])
+        tags = self._col_tags.setdefault(column, array('b'))
+        pos = bisect.bisect_left(rows, row)
+        if (column, row) in self._cells:
+            tags[pos] = value_tag(value)
+        else:
+            rows.insert(pos, row)
+            tags.insert(pos, value_tag(value))
         self._cells[(column, row)] = value
         
         # Update the worksheet XML
         self._update_worksheet_xml(column, row, value)
     
-    def _update_worksheet_xml(self, column: str, row: int, value: str | int | float | bool) -> None:
-        """Update the worksheet XML with new cell value."""
-        from .utils import make_cell_ref, create_cell_element
+    def update(self, values: Mapping[tuple[str, int], NativeTypes]) -> None:
+        """Set many cell values in one call.
         
-        worksheet_xml = self.workbook.get_zip_data(self.worksheet_path)
-        if not worksheet_xml:
-            return
+        New rows are merged into each column's index once per call instead
+        of once per cell, and the XML is edited in row-major order.
+        
+        Args:
+            values: Mapping of (column, row) to value, e.g. {(A, 1): 123.45}
+        """
+        if self.workbook.read_only:
+            raise ValueError(f"Cannot modify sheet '{self.name}' of a read-only workbook")
+        if any(row < 1 for _, row in values):
+            raise ValueError("Row numbers must be 1-based (>= 1)")
         
-        root = etree.fromstring(worksheet_xml)
-        cell_ref = make_cell_ref(column, row)
+        # Row-major XML edit order; resolving columns here also rejects
+        # invalid ones before any state changes
+        xml_order = sorted((row, column_to_index(column), column) for column, row in values)
         
-        # Find existing cell or create location for new one
-        existing_cell = root.xpath(f'//w:c[@{CellAttr.REFERENCE}="{cell_ref}"]', namespaces=NAMESPACES)
+        cells = self._cells
+        new_rows: dict[str, list[int]] = {}
+        for (column, row), value in values.items():
+            if (column, row) in cells:
+                rows = self._col_rows[column]
+                self._col_tags[column][bisect.bisect_left(rows, row)] = value_tag(value)
+            else:
+                new_rows.setdefault(column, []).append(row)
+            cells[(column, row)] = value
         
-        if existing_cell:
-            # Update existing cell
-            cell_elem = existing_cell[0]
-            parent = cell_elem.getparent()
-            if parent is not None:
-                parent.remove(cell_elem)
+        # Merge each column's new rows and their tags; existing tags are kept as is
+        for column, added in new_rows.items():
+            rows = self._col_rows.setdefault(column, [])
+            tags = self._col_tags.setdefault(column, array('b'))
+            added.sort()
+            added_tags = [value_tag(cells[(column, row)]) for row in added]
+            if len(added) * _INSERT_RATIO < len(rows):
+                # Few new rows: shifting the existing entries in C beats rebuilding them
+                for row, tag in zip(added, added_tags):
+                    pos = bisect.bisect_left(rows, row)
+                    rows.insert(pos, row)
+                    tags.insert(pos, tag)
+            else:
+                # Both runs are sorted, so timsort merges them in one linear pass
+                merged = sorted(zip(rows + added, tags.tolist() + added_tags))
+                rows[:] = [row for row, _ in merged]
+                self._col_tags[column] = array('b', [tag for _, tag in merged])
+        
+        for row, _, column in xml_order:
+            self._update_worksheet_xml(column, row, values[(column, row)])
+    
+    def _update_worksheet_xml(self, column: str, row: int, value: str | int | float | bool) -> None:
+        """Update the parsed worksheet XML with new cell value."""
+        if self._root is None:
+            return
         
         # Create new cell element
-        new_cell = create_cell_element(value, cell_ref)
-        
-        # Find the correct row to insert into
-        target_row = None
-        for row_elem in root.xpath('//w:row', namespaces=NAMESPACES):
-            row_num = int(row_elem.get(RowAttr.REFERENCE, '0'))
-            if row_num == row:
-                target_row = row_elem
-                break
-            elif row_num > row:
-                # Need to create a new row before this one
-                break
+        new_cell = create_cell_element(value, make_cell_ref(column, row))
         
+        existing_cell = self._cell_elems.get((column, row))
+        parent = existing_cell.getparent() if existing_cell is not None else None
+        if parent is not None:
+            # Swap the element in place; row and column order are unchanged
+            parent.replace(existing_cell, new_cell)
+        else:
+            self._insert_cell(column, row, new_cell)
+        
+        self._cell_elems[(column, row)] = new_cell
+        self._dirty = True
+    
+    def _insert_cell(self, column: str, row: int, cell_elem: etree._Element) -> None:
+        """Insert a new cell element in sorted position within its row."""
+        target_row = self._row_elems.get(row)
         if target_row is None:
-            # Create new row
-            sheet_data = root.xpath('//w:sheetData', namespaces=NAMESPACES)[0]
-            target_row = etree.SubElement(sheet_data, '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}row')
-            target_row.set(RowAttr.REFERENCE, str(row))
-        
-        # Insert cell in correct position (sorted by column)
-        inserted = False
-        for existing_cell in target_row.xpath('w:c', namespaces=NAMESPACES):
-            existing_ref = existing_cell.get(CellAttr.REFERENCE, '')
-            if existing_ref > cell_ref:
-                target_row.insert(list(target_row).index(existing_cell), new_cell)
-                inserted = True
-                break
-        
-        if not inserted:
-            target_row.append(new_cell)
-        
-        # Update workbook's ZIP data
-        updated_xml = etree.tostring(root, xml_declaration=True, encoding='UTF-8')
-        self.workbook.update_zip_data(self.worksheet_path, updated_xml)
+            target_row = self._insert_row(row)
+        
+        order = self._get_row_col_order(row, target_row)
+        col_index = column_to_index(column)
+        pos = bisect.bisect_left(order, col_index)
+        if pos < len(order):
+            self._cell_elems[(index_to_column(order[pos]), row)].addprevious(cell_elem)
+        else:
+            target_row.append(cell_elem)
+        order.insert(pos, col_index)
+    
+    def _insert_row(self, row: int) -> etree._Element:
+        """Create a row element in sorted position within sheetData."""
+        row_elem = self._root.makeelement(TAG_ROW)
+        row_elem.set(RowAttr.REFERENCE, str(row))
+        
+        pos = bisect.bisect_left(self._row_order, row)
+        if pos < len(self._row_order):
+            self._row_elems[self._row_order[pos]].addprevious(row_elem)
+        else:
+            sheet_data = self._root.find(TAG_SHEETDATA)
+            sheet_data.append(row_elem)
+        
+        self._row_order.insert(pos, row)
+        self._row_elems[row] = row_elem
+        return row_elem
+    
+    def _get_row_col_order(self, row: int, row_elem: etree._Element) -> list[int]:
+        """Get the sorted column indices of the cells in a row."""
+        order = self._row_col_order.get(row)
+        if order is None:
+            order = []
+            for cell_elem in row_elem:
+                try:
+                    column, cell_row = parse_cell_ref(cell_elem.get(CellAttr.REFERENCE, ''))
+                except ValueError:
+                    continue
+                if cell_row == row:
+                    order.append(column_to_index(column))
+            order.sort()
+            self._row_col_order[row] = order
+        return order
+    
+    def serialize(self) -> bytes:
+        """Serialize the worksheet XML including any pending edits."""
+        return editing_etree().tostring(self._root, xml_declaration=True, encoding='UTF-8', standalone=True)
+    
+    def write(self, file: BinaryIO) -> None:
+        """Stream the worksheet XML including any pending edits to a file object."""
+        editing_etree().ElementTree(self._root).write(file, xml_declaration=True, encoding='UTF-8', standalone=True)
     
     def __getitem__(self, column: str | slice) -> Column | Iterator[Column]:
         """Get a column by letter or range of columns by slice.
@@ -131,24 +361,16 @@ class Sheet:
         """
         if isinstance(column, str):
             # Single column
-            if column not in self._columns:
-                self._columns[column] = Column(self, column)
             return self._columns[column]
         
         elif isinstance(column, slice):
             # Column range (A:C)
-            from .utils import column_range
-            
             if column.start is None or column.stop is None:
                 raise ValueError("Column slice must have both start and stop")
             
-            def column_iterator() -> Iterator[Column]:
-                for col in column_range(column.start, column.stop):
-                    if col not in self._columns:
-                        self._columns[col] = Column(self, col)
-                    yield self._columns[col]
-            
-            return column_iterator()
+            # Columns come from the cache, so repeated ranges reuse the same objects;
+            # a list iterator also gives list() an exact __length_hint__
+            return iter(list(map(self._columns.__getitem__, column_range(column.start, column.stop))))
         
         else:
             raise TypeError(f"Column index must be str or slice, got {type(column)}")
\ No newline at end of file
@@ -7,4 +7,45 @@ class formula(str):
 
 
 # Type alias for supported native cell types
-NativeTypes = str | int | float | bool | formula
\ No newline at end of file
+NativeTypes = str | int | float | bool | formula
+
+class ValueTag:
+    """Compact per-cell type codes, stored alongside each column's row index."""
+    EMPTY = 0
+    FLOAT = 1
+    INT = 2
+    STRING = 3
+    BOOL = 4
+    FORMULA = 5
+
+
+# Exact-type lookup; bool and formula are subclasses, so isinstance order would matter
+TAG_BY_TYPE: dict[type, int] = {
+    type(None): ValueTag.EMPTY,
+    float: ValueTag.FLOAT,
+    int: ValueTag.INT,
+    str: ValueTag.STRING,
+    bool: ValueTag.BOOL,
+    formula: ValueTag.FORMULA,
+}
+
+# Value type for each non-empty tag
+TYPE_BY_TAG: dict[int, type] = {tag: value_type for value_type, tag in TAG_BY_TYPE.items() if tag != ValueTag.EMPTY}
+
+
+def value_tag(value: NativeTypes | None) -> int:
+    """Get the ValueTag for a cell value."""
+    tag = TAG_BY_TYPE.get(type(value))
+    if tag is not None:
+        return tag
+    
+    # Subclasses of the native types
+    if isinstance(value, formula):
+        return ValueTag.FORMULA
+    if isinstance(value, bool):
+        return ValueTag.BOOL
+    if isinstance(value, int):
+        return ValueTag.INT
+    if isinstance(value, float):
+        return ValueTag.FLOAT
+    return ValueTag.STRING
@@ -1,7 +1,13 @@
 from __future__ import annotations
+import copy
+import functools
+import itertools
 import re
-from typing import Iterator
-from lxml import etree
+import string
+from array import array
+from typing import Callable, Iterator, Sequence
+from ._xml import etree, editing_etree
+from .types import formula
 
 # Excel column letters: A-Z, AA-ZZ, etc.
 COLUMN_PATTERN = re.compile(r'^[A-Z]+$')
@@ -25,6 +31,18 @@ class CellType:
     NUMBER = 'n'  # Default when no type specified
 
 
+# Clark-notation tags, built once instead of per element
+_WNS = NAMESPACES['w']
+TAG_SHEETDATA = f'{{{_WNS}}}sheetData'
+TAG_ROW = f'{{{_WNS}}}row'
+TAG_C = f'{{{_WNS}}}c'
+TAG_V = f'{{{_WNS}}}v'
+TAG_F = f'{{{_WNS}}}f'
+TAG_SI = f'{{{_WNS}}}si'
+TAG_T = f'{{{_WNS}}}t'
+ATTR_REL_ID = f"{{{NAMESPACES['r']}}}id"
+
+
 # XML attribute constants
 class CellAttr:
     """Excel cell XML attribute constants."""
@@ -38,11 +56,75 @@ class RowAttr:
     REFERENCE = 'r'  # Row number
 
 
+class SharedStrings(Sequence[str]):
+    """Shared strings table packed into one UTF-8 buffer plus offsets.
+    
+    Avoids a str object per entry for large tables. Entries are decoded on
+    first lookup and kept, so every cell using an entry shares one str.
+    """
+    
+    def __init__(self, buffer: bytes = b'', offsets: array | None = None) -> None:
+        self._buffer = buffer
+        self._offsets = offsets if offsets is not None else array('q', [0])
+        self._decoded: list[str | None] = [None] * (len(self._offsets) - 1)
+    
+    def __len__(self) -> int:
+        return len(self._decoded)
+    
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._decoded)))]
+        
+        text = self._decoded[index]
+        if text is None:
+            if index < 0:
+                index += len(self._decoded)
+            text = self._buffer[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+            self._decoded[index] = text
+        return text
+
+
+def _compute_column(index: int) -> str:
+    """Build the column letter(s) for a 0-based index."""
+    result = ""
+    index += 1  # Convert to 1-based
+    while index > 0:
+        index -= 1
+        result = chr(ord('A') + (index % 26)) + result
+        index //= 26
+    return result
+
+
+def _build_columns(count: int) -> tuple[str, ...]:
+    """Build the first count column letters in order.
+    
+    Columns of each width are the letter combinations of that width in
+    lexicographic order, so no per-index div/mod loop is needed.
+    """
+    widths = itertools.count(1)
+    columns = itertools.chain.from_iterable(
+        map(''.join, itertools.product(string.ascii_uppercase, repeat=width)) for width in widths
+    )
+    return tuple(itertools.islice(columns, count))
+
+
+# Every column Excel allows (A..XFD), so conversions are single lookups and
+# equal column letters are the same string object
+MAX_COLUMNS = 16384
+_IDX_TO_COL: tuple[str, ...] = _build_columns(MAX_COLUMNS)
+_COL_TO_IDX: dict[str, int] = {col: i for i, col in enumerate(_IDX_TO_COL)}
+
+
 def column_to_index(col: str) -> int:
     """Convert Excel column letter(s) to 0-based index.
     
     A=0, B=1, ..., Z=25, AA=26, AB=27, etc.
     """
+    index = _COL_TO_IDX.get(col)
+    if index is not None:
+        return index
+    
+    # Slow path: letters past XFD, or invalid input
     if not COLUMN_PATTERN.match(col):
         raise ValueError(f"Invalid column: {col}")
     
@@ -59,14 +141,19 @@ def index_to_column(index: int) -> str:
     """
     if index < 0:
         raise ValueError(f"Column index must be non-negative: {index}")
-    
-    result = ""
-    index += 1  # Convert to 1-based
-    while index > 0:
-        index -= 1
-        result = chr(ord('A') + (index % 26)) + result
-        index //= 26
-    return result
+    if index < MAX_COLUMNS:
+        return _IDX_TO_COL[index]
+    return _compute_column(index)
+
+
+def intern_column(col: str) -> str:
+    """Return the shared string object for a column letter, if it has one."""
+    index = _COL_TO_IDX.get(col)
+    return col if index is None else _IDX_TO_COL[index]
+
+
+_DIGITS = '0123456789'
+_SINGLE_LETTER_COLUMNS: dict[str, str] = {col: col for col in _IDX_TO_COL[:26]}
 
 
 def parse_cell_ref(cell_ref: str) -> tuple[str, int]:
@@ -75,11 +162,74 @@ def parse_cell_ref(cell_ref: str) -> tuple[str, int]:
     Returns:
         Tuple of (column, row) where row is 1-based
     """
+    # Fastest path: single-letter columns, the bulk of refs in most sheets
+    column = _SINGLE_LETTER_COLUMNS.get(cell_ref[:1])
+    if column is not None:
+        digits = cell_ref[1:]
+        if digits.isdigit() and digits.isascii():
+            return column, int(digits)
+    
+    column = cell_ref.rstrip(_DIGITS)
+    index = _COL_TO_IDX.get(column)
+    if index is not None and len(column) < len(cell_ref):
+        return _IDX_TO_COL[index], int(cell_ref[len(column):])
+    
+    # Slow path: lowercase or invalid refs
     match = CELL_PATTERN.match(cell_ref.upper())
     if not match:
         raise ValueError(f"Invalid cell reference: {cell_ref}")
     
-    return match.group(1), int(match.group(2))
+    return intern_column(match.group(1)), int(match.group(2))
+
+
+# Batches this large are parsed by the numba kernel when numba is installed;
+# below it the per-call overhead outweighs the compiled loop
+NUMBA_BATCH_THRESHOLD = 10_000
+_numba_parse_cell_refs: Callable[[list[str]], tuple[list[int], list[int]]] | None = None
+_numba_checked = False
+
+
+def _get_numba_parser() -> Callable[[list[str]], tuple[list[int], list[int]]] | None:
+    """Import the numba kernel on first use, or None if numba is unavailable."""
+    global _numba_parse_cell_refs, _numba_checked
+    if not _numba_checked:
+        _numba_checked = True
+        try:
+            from ._numba import parse_cell_refs as _numba_parse_cell_refs
+        except ImportError:
+            _numba_parse_cell_refs = None
+    return _numba_parse_cell_refs
+
+
+def parse_cell_refs(cell_refs: list[str]) -> list[tuple[str, int] | None]:
+    """Parse many cell references at once.
+    
+    Returns:
+        (column, row) per reference, or None where the reference is invalid
+    """
+    parse = _get_numba_parser() if len(cell_refs) >= NUMBA_BATCH_THRESHOLD else None
+    if parse is None:
+        parsed: list[tuple[str, int] | None] = []
+        for cell_ref in cell_refs:
+            try:
+                parsed.append(parse_cell_ref(cell_ref))
+            except ValueError:
+                parsed.append(None)
+        return parsed
+    
+    columns = _IDX_TO_COL
+    cols, rows = parse(cell_refs)
+    parsed = []
+    for cell_ref, col_index, row in zip(cell_refs, cols, rows):
+        if 0 <= col_index < MAX_COLUMNS:
+            parsed.append((columns[col_index], row))
+        else:
+            # Lowercase, out-of-table or invalid refs take the regular path
+            try:
+                parsed.append(parse_cell_ref(cell_ref))
+            except ValueError:
+                parsed.append(None)
+    return parsed
 
 
 def make_cell_ref(column: str, row: int) -> str:
@@ -95,82 +245,124 @@ def column_range(start: str, end: str) -> Iterator[str]:
     start_idx = column_to_index(start)
     end_idx = column_to_index(end)
     
-    for i in range(start_idx, end_idx + 1):
-        yield index_to_column(i)
+    if end_idx < MAX_COLUMNS:
+        # Within the precomputed table the range is a tuple slice
+        return iter(_IDX_TO_COL[start_idx:end_idx + 1])
+    return map(index_to_column, range(start_idx, end_idx + 1))
+
+
+def _read_number(value_text: str, shared_strings: Sequence[str] | None) -> int | float | str:
+    """Read a numeric cell value, falling back to the raw text."""
+    # int() and float() are already C digit scanners; the job here is to
+    # hand each text to the right one without a failed attempt in between
+    if '.' not in value_text:
+        try:
+            return int(value_text)
+        except ValueError:
+            pass  # Exponent form such as 1E+20, read below as a float
+    try:
+        return float(value_text)
+    except ValueError:
+        return value_text  # Return as string if parsing fails
+
+
+def _read_shared_string(value_text: str, shared_strings: Sequence[str] | None) -> str:
+    """Read a cell value stored as an index into the shared strings table."""
+    if shared_strings is None:
+        return f"<shared_string_{value_text}>"  # Placeholder for now
+    try:
+        return shared_strings[int(value_text)]
+    except (IndexError, ValueError):
+        return f"<invalid_shared_string_{value_text}>"
+
+
+def _read_boolean(value_text: str, shared_strings: Sequence[str] | None) -> bool:
+    """Read a boolean cell value."""
+    return value_text == '1'
+
 
+def _read_inline_string(value_text: str, shared_strings: Sequence[str] | None) -> str:
+    """Read a string stored directly in the cell."""
+    return value_text
 
-def get_cell_value_from_element(cell_elem: etree._Element, shared_strings: list[str] | None = None) -> str | int | float | bool | None:
+
+# Value readers by cell type, chosen once per cell so each stays monomorphic
+_READERS: dict[str, Callable[[str, Sequence[str] | None], str | int | float | bool]] = {
+    CellType.SHARED_STRING: _read_shared_string,
+    CellType.BOOLEAN: _read_boolean,
+    CellType.INLINE_STRING: _read_inline_string,
+    CellType.NUMBER: _read_number,
+}
+
+
+def get_cell_value_from_element(cell_elem: etree._Element, shared_strings: Sequence[str] | None = None,
+                                formulas: dict[str, formula] | None = None) -> str | int | float | bool | None:
     """Extract cell value from XML element.
     
     Handles different cell types: string, number, boolean, formulas, etc.
+    When given, formulas interns formula objects by their text.
     """
-    from .types import formula
-    
-    # Check for formula first
-    formula_elem = cell_elem.find('w:f', NAMESPACES)
-    if formula_elem is not None and formula_elem.text:
-        return formula(formula_elem.text)
+    # A cell has at most a formula and a value child, so scan them directly
+    # rather than paying for two namespace-resolving find() calls
+    value_text = None
+    for child in cell_elem:
+        tag = child.tag
+        if tag == TAG_F:
+            # Formulas take precedence over cached values
+            text = child.text
+            if text:
+                if formulas is None:
+                    return formula(text)
+                value = formulas.get(text)
+                if value is None:
+                    value = formulas[text] = formula(text)
+                return value
+        elif tag == TAG_V:
+            value_text = child.text
     
-    # Get cell type
-    cell_type = cell_elem.get(CellAttr.TYPE, CellType.NUMBER)
-    
-    # Find value element
-    value_elem = cell_elem.find('w:v', NAMESPACES)
-    if value_elem is None:
-        return None
-    
-    value_text = value_elem.text
     if not value_text:
         return None
     
-    # Handle different cell types
-    if cell_type == CellType.SHARED_STRING:
-        if shared_strings is None:
-            return f"<shared_string_{value_text}>"  # Placeholder for now
-        try:
-            return shared_strings[int(value_text)]
-        except (IndexError, ValueError):
-            return f"<invalid_shared_string_{value_text}>"
-    
-    elif cell_type == CellType.BOOLEAN:
-        return value_text == '1'
+    # Untyped cells are numbers, the common case; skip the reader lookup
+    cell_type = cell_elem.get(CellAttr.TYPE)
+    if cell_type is None:
+        return _read_number(value_text, shared_strings)
     
-    elif cell_type == CellType.INLINE_STRING:
-        return value_text
+    # Unknown types are read as numbers too
+    reader = _READERS.get(cell_type, _read_number)
+    return reader(value_text, shared_strings)
+
+
+@functools.cache
+def _cell_template(cell_type: str | None, child_tag: str) -> etree._Element:
+    """Get a prebuilt cell element to copy for new cells.
     
-    else:  # Number (default)
-        try:
-            # Try integer first
-            if '.' not in value_text:
-                return int(value_text)
-            return float(value_text)
-        except ValueError:
-            return value_text  # Return as string if parsing fails
+    Copying a finished element in lxml is far cheaper than building the
+    cell, its attributes and its child one call at a time.
+    """
+    lxml_etree = editing_etree()
+    cell = lxml_etree.Element(TAG_C)
+    cell.set(CellAttr.REFERENCE, '')  # Set first so r stays ahead of t
+    if cell_type is not None:
+        cell.set(CellAttr.TYPE, cell_type)
+    lxml_etree.SubElement(cell, child_tag)
+    return cell
 
 
 def create_cell_element(value: str | int | float | bool, cell_ref: str) -> etree._Element:
     """Create XML element for a cell with the given value."""
-    from .types import formula
-    
-    cell = etree.Element('{http://schemas.openxmlformats.org/spreadsheetml/2006/main}c')
-    cell.set(CellAttr.REFERENCE, cell_ref)
-    
     if isinstance(value, formula):
-        # Create formula element (no type attribute, no value element)
-        f_elem = etree.SubElement(cell, '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}f')
-        f_elem.text = str(value)
+        # Formula element only (no type attribute, no value element)
+        cell_type, child_tag, text = None, TAG_F, str(value)
     elif isinstance(value, bool):
-        # Create value element for boolean
-        v_elem = etree.SubElement(cell, '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}v')
-        cell.set(CellAttr.TYPE, CellType.BOOLEAN)
-        v_elem.text = '1' if value else '0'
+        cell_type, child_tag, text = CellType.BOOLEAN, TAG_V, '1' if value else '0'
     elif isinstance(value, (int, float)):
-        # Create value element for numbers (no type attribute needed)
-        v_elem = etree.SubElement(cell, '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}v')
-        v_elem.text = str(value)
+        # Numbers need no type attribute; str() of a float is its shortest round-trip form
+        cell_type, child_tag, text = None, TAG_V, str(value)
     else:  # String - store as inline string
-        v_elem = etree.SubElement(cell, '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}v')
-        cell.set(CellAttr.TYPE, CellType.INLINE_STRING)
-        v_elem.text = str(value)
+        cell_type, child_tag, text = CellType.INLINE_STRING, TAG_V, str(value)
     
+    cell = copy.copy(_cell_template(cell_type, child_tag))
+    cell.set(CellAttr.REFERENCE, cell_ref)
+    cell[0].text = text
     return cell
\ No newline at end of file
@@ -1,71 +1,138 @@
 from __future__ import annotations
+import copy
+import os
+import shutil
+import struct
+import tempfile
 import zipfile
+from array import array
+from io import BufferedWriter, BytesIO
 from pathlib import Path
-from lxml import etree
+from typing import BinaryIO
+from ._xml import etree, XPath, iterparse, release
 from .sheet import Sheet
-from .utils import NAMESPACES
+from .types import formula
+from .utils import NAMESPACES, TAG_SI, TAG_T, ATTR_REL_ID, SharedStrings
+
+
+# Compiled once; lxml skips re-parsing the expression on every call
+_XP_SHEETS = XPath('//w:sheet', namespaces=NAMESPACES)
+_XP_REL = XPath('//pkg:Relationship[@Id=$rel_id]', namespaces=NAMESPACES)
+
+# Fast compression for rewritten members; untouched members keep their original bytes
+_COMPRESS_LEVEL = 1
+_WRITE_BUFFER = 256 * 1024
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+def _copy_raw_member(source: BinaryIO, info: zipfile.ZipInfo, zip_out: zipfile.ZipFile) -> bool:
+    """Copy a member's compressed bytes into zip_out without recompressing.
+    
+    zipfile has no public API for this, so the local header is written
+    directly and the entry registered for the central directory. Returns
+    False for members that need the regular path (encrypted or ZIP64).
+    """
+    if (info.flag_bits & 0x1 or info.file_size > zipfile.ZIP64_LIMIT
+            or info.compress_size > zipfile.ZIP64_LIMIT or info.header_offset > zipfile.ZIP64_LIMIT):
+        return False
+    
+    # Locate the data after the source member's local header
+    source.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(source.read(_LOCAL_HEADER.size))
+    source.seek(header[-2] + header[-1], os.SEEK_CUR)
+    
+    out_info = copy.copy(info)
+    out_info.flag_bits &= ~0x08  # Sizes go in the local header, no data descriptor
+    out_info.header_offset = zip_out.fp.tell()
+    zip_out.fp.write(out_info.FileHeader(False))
+    
+    remaining = info.compress_size
+    while remaining:
+        chunk = source.read(min(remaining, 1 << 20))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated member: {info.filename}")
+        zip_out.fp.write(chunk)
+        remaining -= len(chunk)
+    
+    zip_out.filelist.append(out_info)
+    zip_out.NameToInfo[out_info.filename] = out_info
+    zip_out.start_dir = zip_out.fp.tell()
+    zip_out._didModify = True
+    return True
 
 
 class Workbook:
     """Represents an Excel workbook with sheet access and save functionality."""
     
-    def __init__(self, filename: Path) -> None:
+    def __init__(self, filename: Path | bytes, read_only: bool = False) -> None:
         """Initialize a workbook.
         
         Args:
-            filename: Path to the Excel file
+            filename: Path to the Excel file, or the file's bytes
+            read_only: Stream sheet data without keeping the XML for editing
         """
-        self.filename = Path(filename)
-        self._zip_data: dict[str, bytes] = {}
-        self._sheets: dict[str, Sheet] = {}
-        self._shared_strings: list[str] = []
+        # Workbooks loaded from bytes have no file until saved somewhere
+        self._data = filename if isinstance(filename, bytes) else None
+        self.filename: Path | None = None if self._data is not None else Path(filename)
+        self.read_only = read_only
+        self._zip: zipfile.ZipFile | None = None
+        self._zip_names: set[str] = set()
+        self._zip_data: dict[str, bytes] = {}  # Members replaced since load
+        self._dirty_paths: set[str] = set()  # Members replaced since load
+        self._sheet_paths: dict[str, str] = {}  # Sheet name -> worksheet path, in workbook order
+        self._sheets: dict[str, Sheet] = {}  # Sheets loaded so far
+        self._shared_strings: SharedStrings | None = None  # Loaded with the first sheet that needs it
+        self._formulas: dict[str, formula] = {}  # Formula objects interned by text across sheets
         
-        # Load the XLSX file into memory
+        # Open the XLSX file and parse its structure
         self._load_workbook()
     
     def _load_workbook(self) -> None:
-        """Load XLSX file into memory and parse structure."""
-        if not self.filename.exists():
+        """Open the XLSX file and parse structure."""
+        if self._data is None and not self.filename.exists():
             raise FileNotFoundError(f"Workbook file not found: {self.filename}")
         
-        # Load entire ZIP into memory
-        with zipfile.ZipFile(self.filename, 'r') as zip_file:
-            for name in zip_file.namelist():
-                self._zip_data[name] = zip_file.read(name)
+        # Keep the ZIP open; members are decompressed on first use
+        self._zip = self._open_zip()
+        self._zip_names = set(self._zip.namelist())
         
-        # Load shared strings first, then parse workbook structure
-        self._load_shared_strings()
+        # Only the sheet list is parsed up front
         self._parse_workbook_structure()
     
+    def _open_zip(self) -> zipfile.ZipFile:
+        """Open the source ZIP; in-memory sources are wrapped without copying."""
+        return zipfile.ZipFile(BytesIO(self._data) if self._data is not None else self.filename, 'r')
+    
     def _parse_workbook_structure(self) -> None:
         """Parse workbook.xml to get sheet information."""
-        workbook_xml = self._zip_data.get('xl/workbook.xml')
+        workbook_xml = self.get_zip_data('xl/workbook.xml')
         if not workbook_xml:
             raise ValueError("Invalid XLSX file: missing xl/workbook.xml")
         
         root = etree.fromstring(workbook_xml)
         
+        # Relationships resolve each sheet to its worksheet path; parse them once
+        rels_xml = self.get_zip_data('xl/_rels/workbook.xml.rels')
+        rels_root = etree.fromstring(rels_xml) if rels_xml else None
+        
         # Find all sheets
-        for sheet_elem in root.xpath('//w:sheet', namespaces=NAMESPACES):
+        for sheet_elem in _XP_SHEETS(root):
             sheet_name = sheet_elem.get('name')
             sheet_id = sheet_elem.get('sheetId')
-            rel_id = sheet_elem.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
+            rel_id = sheet_elem.get(ATTR_REL_ID)
             
             if sheet_name and sheet_id and rel_id:
-                # Create sheet object - it will load its own data
-                worksheet_path = self._get_worksheet_path(rel_id)
+                # Sheet data is loaded on first access
+                worksheet_path = self._get_worksheet_path(rels_root, rel_id)
                 if worksheet_path:
-                    self._sheets[sheet_name] = Sheet(sheet_name, worksheet_path, self)
+                    self._sheet_paths[sheet_name] = worksheet_path
     
-    def _get_worksheet_path(self, rel_id: str) -> str | None:
+    def _get_worksheet_path(self, rels_root: etree._Element | None, rel_id: str) -> str | None:
         """Get worksheet path from relationship ID."""
-        rels_xml = self._zip_data.get('xl/_rels/workbook.xml.rels')
-        if not rels_xml:
+        if rels_root is None:
             return None
         
-        root = etree.fromstring(rels_xml)
-        
-        for rel in root.xpath(f'//pkg:Relationship[@Id="{rel_id}"]', namespaces=NAMESPACES):
+        for rel in _XP_REL(rels_root, rel_id=rel_id):
             target = rel.get('Target')
             if target:
                 return f'xl/{target}'
@@ -74,24 +141,31 @@ class Workbook:
     
     def _load_shared_strings(self) -> None:
         """Load shared strings table."""
-        shared_strings_xml = self._zip_data.get('xl/sharedStrings.xml')
-        if not shared_strings_xml:
+        shared_strings_file = self.open_zip_member('xl/sharedStrings.xml')
+        if shared_strings_file is None:
+            self._shared_strings = SharedStrings()
             return  # No shared strings
         
-        root = etree.fromstring(shared_strings_xml)
-        
-        for si in root.xpath('//w:si', namespaces=NAMESPACES):
-            # Handle both simple text and rich text
-            t_elem = si.find('w:t', NAMESPACES)
-            if t_elem is not None and t_elem.text:
-                self._shared_strings.append(t_elem.text)
-            else:
-                # Handle rich text by concatenating all text elements
-                text_parts = []
-                for t in si.xpath('.//w:t', namespaces=NAMESPACES):
-                    if t.text:
-                        text_parts.append(t.text)
-                self._shared_strings.append(''.join(text_parts))
+        parts: list[bytes] = []
+        offsets = array('q', [0])
+        total = 0
+        with shared_strings_file:
+            for si in iterparse(shared_strings_file, tag=TAG_SI):
+                # Simple text is a single <t>; rich text splits it across runs
+                if len(si) and si[0].tag == TAG_T and si[0].text:
+                    text = si[0].text
+                else:
+                    text = ''.join([t.text for t in si.iter(TAG_T) if t.text])
+                
+                encoded = text.encode('utf-8')
+                parts.append(encoded)
+                total += len(encoded)
+                offsets.append(total)
+                
+                # Free processed entries so memory stays flat
+                release(si)
+        
+        self._shared_strings = SharedStrings(b''.join(parts), offsets)
     
     def __getitem__(self, sheet_name: str) -> Sheet:
         """Get a sheet by name.
@@ -102,21 +176,55 @@ class Workbook:
         Returns:
             Sheet object
         """
-        if sheet_name not in self._sheets:
-            raise KeyError(f"Sheet '{sheet_name}' not found in workbook")
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None:
+            worksheet_path = self._sheet_paths.get(sheet_name)
+            if worksheet_path is None:
+                raise KeyError(f"Sheet '{sheet_name}' not found in workbook")
+            sheet = self._sheets[sheet_name] = Sheet(sheet_name, worksheet_path, self)
         
-        return self._sheets[sheet_name]
+        return sheet
+    
+    @property
+    def sheet_names(self) -> list[str]:
+        """Names of all sheets, in workbook order."""
+        return list(self._sheet_paths)
     
     def get_zip_data(self, path: str) -> bytes | None:
-        """Get data for a specific ZIP member."""
-        return self._zip_data.get(path)
+        """Get data for a specific ZIP member.
+        
+        Untouched members are decompressed on every call and not cached;
+        only members replaced through update_zip_data are kept in memory.
+        """
+        self._check_open()
+        data = self._zip_data.get(path)
+        if data is None and path in self._zip_names:
+            data = self._zip.read(path)
+        return data
+    
+    def open_zip_member(self, path: str) -> BinaryIO | None:
+        """Open a ZIP member for streaming, or None if it is missing or empty.
+        
+        Large parts (worksheets, shared strings) are parsed from this stream
+        so their decompressed XML is never held in memory as a whole.
+        """
+        self._check_open()
+        data = self._zip_data.get(path)
+        if data is not None:
+            return BytesIO(data) if data else None
+        if path not in self._zip_names or not self._zip.getinfo(path).file_size:
+            return None
+        return self._zip.open(path)
     
     def update_zip_data(self, path: str, data: bytes) -> None:
         """Update data for a specific ZIP member."""
         self._zip_data[path] = data
+        self._dirty_paths.add(path)
     
-    def get_shared_strings(self) -> list[str]:
-        """Get the shared strings table."""
+    def get_shared_strings(self) -> SharedStrings:
+        """Get the shared strings table, loading it on first use."""
+        if self._shared_strings is None:
+            self._load_shared_strings()
         return self._shared_strings
     
     def save(self, filename: str | Path | None = None) -> None:
@@ -126,8 +234,90 @@ class Workbook:
             filename: Path to save the workbook (defaults to original filename)
         """
         target_path = Path(filename) if filename else self.filename
+        if target_path is None:
+            raise ValueError("Workbook was loaded from bytes; a filename is required to save it")
+        # Before the target is opened, so a closed workbook never truncates an existing file
+        self._check_open()
+        
+        edited_sheets = self._edited_sheets()
         
-        # Create new ZIP with updated data
-        with zipfile.ZipFile(target_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for path, data in self._zip_data.items():
-                zip_file.writestr(path, data)
+        # The source ZIP is still open for reading, so never write over it directly
+        if self.filename is not None and target_path.exists() and target_path.samefile(self.filename):
+            fd, temp_name = tempfile.mkstemp(suffix='.xlsx', dir=target_path.parent)
+            try:
+                with os.fdopen(fd, 'wb', buffering=_WRITE_BUFFER) as target:
+                    self._write_zip(target, edited_sheets)
+                self.close()
+                os.replace(temp_name, target_path)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+            self._zip = self._open_zip()
+            self._zip_data.clear()
+            self._dirty_paths.clear()
+            
+            # The source file now matches the edited trees
+            for sheet in edited_sheets.values():
+                sheet._dirty = False
+        else:
+            try:
+                with open(target_path, 'wb', buffering=_WRITE_BUFFER) as target:
+                    self._write_zip(target, edited_sheets)
+            except BaseException:
+                # Leave no truncated file behind
+                target_path.unlink(missing_ok=True)
+                raise
+    
+    def to_bytes(self) -> bytes:
+        """Get the XLSX file contents, including any pending edits, without touching disk.
+        
+        Returns:
+            The workbook as it would be saved, e.g. for load_workbook(data)
+        """
+        buffer = BytesIO()
+        self._write_zip(buffer, self._edited_sheets())
+        return buffer.getvalue()
+    
+    def _edited_sheets(self) -> dict[str, Sheet]:
+        """Get sheets with edits by worksheet path, to serialize straight into the output ZIP."""
+        return {sheet.worksheet_path: sheet for sheet in self._sheets.values() if sheet._dirty}
+    
+    def _write_zip(self, target: BinaryIO, edited_sheets: dict[str, Sheet]) -> None:
+        """Write all ZIP members, copying untouched ones straight from the source."""
+        self._check_open()
+        # Raw copies read the handle the offsets came from, even if the path was replaced since load;
+        # open members track their own position in it, so seeking here does not disturb them
+        source = self._zip.fp
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED, compresslevel=_COMPRESS_LEVEL) as zip_file:
+            for info in self._zip.infolist():
+                sheet = edited_sheets.get(info.filename)
+                if sheet is not None:
+                    # lxml emits small chunks; hand the compressor large ones
+                    with zip_file.open(info.filename, 'w') as dst, BufferedWriter(dst, _WRITE_BUFFER) as buffered:
+                        sheet.write(buffered)
+                elif info.filename in self._dirty_paths:
+                    zip_file.writestr(info.filename, self._zip_data[info.filename])
+                elif not _copy_raw_member(source, info, zip_file):
+                    with self._zip.open(info) as src, zip_file.open(info.filename, 'w') as dst:
+                        shutil.copyfileobj(src, dst)
+            
+            # Members added since load
+            for path in self._dirty_paths - self._zip_names:
+                zip_file.writestr(path, self._zip_data[path])
+    
+    def _check_open(self) -> None:
+        """Raise if the workbook was closed; unread parts are no longer reachable."""
+        if self._zip is None:
+            raise ValueError("I/O operation on closed workbook")
+    
+    def close(self) -> None:
+        """Close the underlying XLSX file."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+    
+    def __enter__(self) -> Workbook:
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -1,14 +1,19 @@
 """
 Basic functionality tests for libxlsx using the Book1.xlsx fixture.
 """
+import os
+import shutil
+import zipfile
 import pytest
 from pathlib import Path
 from libxlsx import load_workbook, formula
 from libxlsx.const import A, B, C, D
+from libxlsx.utils import parse_cell_refs, NUMBA_BATCH_THRESHOLD, _read_number, column_to_index, index_to_column
 
 
 # Get fixture path
 FIXTURE_PATH = Path(__file__).parent / "fixtures" / "Book1.xlsx"
+EMPTY_FIXTURE_PATH = Path(__file__).parent / "fixtures" / "Book0.xlsx"
 
 
 @pytest.fixture
@@ -17,6 +22,13 @@ def sample_workbook():
     return load_workbook(FIXTURE_PATH)
 
 
+@pytest.fixture
+def empty_workbook_sheet():
+    """Load the first sheet of the empty workbook for testing."""
+    workbook = load_workbook(EMPTY_FIXTURE_PATH)
+    return workbook[workbook.sheet_names[0]]
+
+
 @pytest.fixture
 def temp_workbook_path(tmp_path):
     """Create a temporary path for saving test workbooks."""
@@ -35,19 +47,62 @@ class TestBasicLoading:
     def test_get_sheet_names(self, sample_workbook):
         """Test that we can access sheets."""
         # Let's discover what sheets exist
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         assert len(sheet_names) > 0
         print(f"Available sheets: {sheet_names}")
     
     def test_access_sheet(self, sample_workbook):
         """Test that we can access a sheet."""
         # Try common sheet names
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         first_sheet_name = sheet_names[0]
         
         sheet = sample_workbook[first_sheet_name]
         assert sheet is not None
         assert sheet.name == first_sheet_name
+    
+    def test_sheets_load_on_access(self, sample_workbook):
+        """Test that sheets are only parsed when first accessed."""
+        first_sheet_name = sample_workbook.sheet_names[0]
+        assert first_sheet_name not in sample_workbook._sheets
+        assert sample_workbook._shared_strings is None
+        
+        sheet = sample_workbook[first_sheet_name]
+        assert sample_workbook._sheets[first_sheet_name] is sheet
+        assert sample_workbook[first_sheet_name] is sheet
+    
+    def test_load_read_only(self, sample_workbook):
+        """Test that a read-only workbook loads the same cell values."""
+        read_only_workbook = load_workbook(FIXTURE_PATH, read_only=True)
+        sheet_names = sample_workbook.sheet_names
+        
+        sheet = sample_workbook[sheet_names[0]]
+        read_only_sheet = read_only_workbook[sheet_names[0]]
+        assert read_only_sheet._cells == sheet._cells
+    
+    def test_loaded_parts_are_not_cached(self):
+        """Test that worksheet and shared strings XML are streamed, not kept in memory."""
+        for read_only in (True, False):
+            workbook = load_workbook(FIXTURE_PATH, read_only=read_only)
+            workbook[workbook.sheet_names[0]]
+            assert workbook._zip_data == {}
+    
+    def test_load_from_bytes(self, sample_workbook, temp_workbook_path):
+        """Test that a workbook loads from its bytes and saves to a new file."""
+        bytes_workbook = load_workbook(FIXTURE_PATH.read_bytes())
+        assert bytes_workbook.filename is None
+        assert bytes_workbook.sheet_names == sample_workbook.sheet_names
+        
+        sheet_name = sample_workbook.sheet_names[0]
+        assert bytes_workbook[sheet_name]._cells == sample_workbook[sheet_name]._cells
+        
+        # There is no original file to save over
+        with pytest.raises(ValueError):
+            bytes_workbook.save()
+        
+        bytes_workbook[sheet_name][A][1] = "From bytes"
+        bytes_workbook.save(temp_workbook_path)
+        assert load_workbook(temp_workbook_path)[sheet_name][A][1] == "From bytes"
 
 
 class TestCellReading:
@@ -55,7 +110,7 @@ class TestCellReading:
     
     def test_explore_fixture_content(self, sample_workbook):
         """Explore what's in our fixture to understand the data structure."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         first_sheet = sample_workbook[sheet_names[0]]
         
         print(f"\nSheet: {first_sheet.name}")
@@ -70,7 +125,7 @@ class TestCellReading:
     
     def test_read_specific_cells(self, sample_workbook):
         """Test reading specific cell values."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         # Test accessing cells via our API
@@ -80,6 +135,33 @@ class TestCellReading:
         # These might be None if the cells are empty, which is fine
         print(f"A1: {repr(value_a1)}")
         print(f"B1: {repr(value_b1)}")
+    
+    def test_parse_cell_refs_batch(self):
+        """Test that batch reference parsing matches parsing one at a time."""
+        refs = ["A1", "ab3", "XFD9", "XFE2", "1A", "A", "Z99x", "A" + "9" * 25, "ABCDEFGHIJKLMNOP1"]
+        expected = [("A", 1), ("AB", 3), ("XFD", 9), ("XFE", 2), None, None, None,
+                    ("A", int("9" * 25)), ("ABCDEFGHIJKLMNOP", 1)]
+        assert parse_cell_refs(refs) == expected
+        
+        # Large enough to use the numba kernel when it is installed
+        repeat = NUMBA_BATCH_THRESHOLD // len(refs) + 1
+        assert parse_cell_refs(refs * repeat) == expected * repeat
+    
+    def test_column_conversions(self):
+        """Test column letter/index conversion across letter widths and past XFD."""
+        for index, column in [(0, "A"), (25, "Z"), (26, "AA"), (701, "ZZ"), (702, "AAA"), (16383, "XFD"), (16384, "XFE")]:
+            assert index_to_column(index) == column
+            assert column_to_index(column) == index
+    
+    def test_read_number(self):
+        """Test that numeric cell text keeps its int/float distinction."""
+        assert _read_number("10", None) == 10
+        assert type(_read_number("10", None)) is int
+        assert _read_number("-2.5", None) == -2.5
+        assert _read_number("1E+20", None) == 1e20
+        assert type(_read_number("1E+20", None)) is float
+        assert _read_number("1.5E-3", None) == 0.0015
+        assert _read_number("#N/A", None) == "#N/A"
 
 
 class TestCellWriting:
@@ -87,7 +169,7 @@ class TestCellWriting:
     
     def test_write_cell_values(self, sample_workbook):
         """Test writing different types of values to cells."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         # Test writing different data types
@@ -104,7 +186,7 @@ class TestCellWriting:
     
     def test_write_formula(self, sample_workbook):
         """Test writing a formula."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         # Write some numbers to sum
@@ -125,7 +207,7 @@ class TestColumnOperations:
     
     def test_column_iteration(self, sample_workbook):
         """Test iterating over a column."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         # Add some test data
@@ -142,9 +224,20 @@ class TestColumnOperations:
         assert "Second" in values
         assert "Third" in values
     
+    def test_column_iteration_order(self, empty_workbook_sheet):
+        """Test that column iteration follows row order regardless of write order."""
+        sheet = empty_workbook_sheet
+        sheet[C][7] = "Seventh"
+        sheet[C][2] = "Second"
+        sheet[C][4] = "Fourth"
+        sheet[C][2] = "Second again"
+        
+        assert list(sheet[C]) == ["Second again", "Fourth", "Seventh"]
+        assert len(sheet[C]) == 3
+    
     def test_column_slicing(self, sample_workbook):
         """Test slicing a column."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         # Add test data
@@ -162,7 +255,7 @@ class TestColumnOperations:
     
     def test_column_range(self, sample_workbook):
         """Test iterating over multiple columns."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         # Add test data across columns
@@ -185,7 +278,7 @@ class TestSaveLoad:
     
     def test_save_workbook(self, sample_workbook, temp_workbook_path):
         """Test saving a modified workbook."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         # Make some changes
@@ -200,7 +293,7 @@ class TestSaveLoad:
     
     def test_save_and_reload(self, sample_workbook, temp_workbook_path):
         """Test that saved data persists when reloading."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         # Add unique test data
@@ -221,6 +314,111 @@ class TestSaveLoad:
         assert reloaded_sheet[A][200] == test_string
         assert reloaded_sheet[B][200] == test_number
 
+    
+    def test_new_rows_keep_sorted_order(self, sample_workbook, temp_workbook_path):
+        """Test that rows created by writes are placed in row order."""
+        sheet_names = sample_workbook.sheet_names
+        sheet = sample_workbook[sheet_names[0]]
+        
+        sheet[A][300] = "Last"
+        sheet[A][250] = "Middle"
+        sheet[B][250] = "Middle B"
+        
+        sample_workbook.save(temp_workbook_path)
+        
+        reloaded_sheet = load_workbook(temp_workbook_path)[sheet_names[0]]
+        row_numbers = [int(row.get('r')) for row in reloaded_sheet._row_elems.values()]
+        assert row_numbers == sorted(row_numbers)
+        assert reloaded_sheet[A][250] == "Middle"
+        assert reloaded_sheet[B][250] == "Middle B"
+        assert reloaded_sheet[A][300] == "Last"
+    
+    def test_new_cells_keep_column_order(self, sample_workbook, temp_workbook_path):
+        """Test that cells are ordered by column index, not alphabetically."""
+        sheet_names = sample_workbook.sheet_names
+        sheet = sample_workbook[sheet_names[0]]
+        
+        sheet["AA"][260] = "AA"
+        sheet[B][260] = "B"
+        sheet["Z"][260] = "Z"
+        sheet["AB"][260] = "AB"
+        
+        sample_workbook.save(temp_workbook_path)
+        
+        reloaded_sheet = load_workbook(temp_workbook_path)[sheet_names[0]]
+        cell_refs = [cell.get('r') for cell in reloaded_sheet._row_elems[260]]
+        assert cell_refs == ["B260", "Z260", "AA260", "AB260"]
+    
+    def test_save_over_original(self, temp_workbook_path):
+        """Test saving back to the file the workbook was loaded from."""
+        shutil.copyfile(FIXTURE_PATH, temp_workbook_path)
+        
+        with load_workbook(temp_workbook_path) as workbook:
+            sheet_names = workbook.sheet_names
+            workbook[sheet_names[0]][A][400] = "In place"
+            workbook.save()
+        
+        with load_workbook(temp_workbook_path) as reloaded_workbook:
+            reloaded_sheet = reloaded_workbook[sheet_names[0]]
+            assert reloaded_sheet[A][400] == "In place"
+            assert reloaded_sheet[A][1] == load_workbook(FIXTURE_PATH)[sheet_names[0]][A][1]
+    
+    def test_save_twice(self, sample_workbook, tmp_path):
+        """Test that edits are written by every save, not just the first."""
+        sheet_names = sample_workbook.sheet_names
+        sample_workbook[sheet_names[0]][A][100] = "Saved Data"
+        
+        for name in ("first.xlsx", "second.xlsx"):
+            sample_workbook.save(tmp_path / name)
+            reloaded_sheet = load_workbook(tmp_path / name)[sheet_names[0]]
+            assert reloaded_sheet[A][100] == "Saved Data"
+    
+    def test_save_copies_untouched_members(self, sample_workbook, temp_workbook_path):
+        """Test that members we did not edit are copied without recompressing."""
+        sheet = sample_workbook[sample_workbook.sheet_names[0]]
+        sheet[A][100] = "Saved Data"
+        sample_workbook.save(temp_workbook_path)
+        
+        with zipfile.ZipFile(FIXTURE_PATH) as original, zipfile.ZipFile(temp_workbook_path) as saved:
+            assert saved.testzip() is None
+            for info in original.infolist():
+                if info.filename == sheet.worksheet_path:
+                    continue
+                saved_info = saved.getinfo(info.filename)
+                assert saved_info.CRC == info.CRC
+                assert saved_info.compress_size == info.compress_size
+    
+    def test_save_after_source_replaced(self, tmp_path, temp_workbook_path):
+        """Test that saving copies from the file as loaded, not whatever now sits at its path."""
+        source_path = tmp_path / "source.xlsx"
+        shutil.copyfile(FIXTURE_PATH, source_path)
+        workbook = load_workbook(source_path)
+        sheet = workbook[workbook.sheet_names[0]]
+        sheet[A][100] = "Saved Data"
+        
+        os.replace(shutil.copyfile(FIXTURE_PATH.with_name("Book2.xlsx"), tmp_path / "other.xlsx"), source_path)
+        workbook.save(temp_workbook_path)
+        
+        with zipfile.ZipFile(FIXTURE_PATH) as original, zipfile.ZipFile(temp_workbook_path) as saved:
+            assert saved.testzip() is None
+            for info in original.infolist():
+                if info.filename != sheet.worksheet_path:
+                    assert saved.read(info.filename) == original.read(info.filename)
+        assert load_workbook(temp_workbook_path)[workbook.sheet_names[0]][A][100] == "Saved Data"
+    
+    def test_failed_save_removes_target(self, sample_workbook, temp_workbook_path, monkeypatch):
+        """Test that a save that fails midway leaves no partial file behind."""
+        sheet = sample_workbook[sample_workbook.sheet_names[0]]
+        sheet[A][100] = "Saved Data"
+        
+        def fail(target):
+            raise RuntimeError("write failed")
+        monkeypatch.setattr(sheet, "write", fail)
+        
+        with pytest.raises(RuntimeError):
+            sample_workbook.save(temp_workbook_path)
+        assert not temp_workbook_path.exists()
+
 
 class TestErrorHandling:
     """Test error conditions and edge cases."""
@@ -232,7 +430,7 @@ class TestErrorHandling:
     
     def test_invalid_row_numbers(self, sample_workbook):
         """Test invalid row numbers."""
-        sheet_names = list(sample_workbook._sheets.keys())
+        sheet_names = sample_workbook.sheet_names
         sheet = sample_workbook[sheet_names[0]]
         
         with pytest.raises(ValueError, match="Row numbers must be 1-based"):
@@ -240,6 +438,45 @@ class TestErrorHandling:
         
         with pytest.raises(ValueError, match="Row numbers must be 1-based"):
             sheet[A][-1]  # Negative rows should be invalid
+    
+    def test_invalid_column_write_leaves_sheet_unchanged(self, sample_workbook):
+        """Test that writes to invalid columns fail before touching any state."""
+        sheet = sample_workbook[sample_workbook.sheet_names[0]]
+        xml_before = sheet.serialize()
+        
+        with pytest.raises(ValueError):
+            sheet["c"][60] = 5
+        with pytest.raises(ValueError):
+            sheet.update({(A, 60): 1, ("c", 61): 2})
+        
+        assert (A, 60) not in sheet._cells
+        assert ("c", 60) not in sheet._cells
+        assert "c" not in sheet._col_rows
+        assert 60 not in sheet._col_rows.get(A, [])
+        assert sheet.serialize() == xml_before
+    
+    def test_write_read_only(self):
+        """Test that writing to a read-only workbook fails."""
+        workbook = load_workbook(FIXTURE_PATH, read_only=True)
+        sheet_names = workbook.sheet_names
+        sheet = workbook[sheet_names[0]]
+        
+        with pytest.raises(ValueError, match="read-only"):
+            sheet[A][1] = "Not allowed"
+    
+    def test_use_after_close(self, temp_workbook_path):
+        """Test that a closed workbook fails clearly instead of with AttributeError."""
+        temp_workbook_path.write_bytes(b"existing")
+        with load_workbook(FIXTURE_PATH) as workbook:
+            sheet_names = workbook.sheet_names
+        
+        with pytest.raises(ValueError, match="closed workbook"):
+            workbook[sheet_names[0]]
+        with pytest.raises(ValueError, match="closed workbook"):
+            workbook.save(temp_workbook_path)
+        with pytest.raises(ValueError, match="closed workbook"):
+            workbook.to_bytes()
+        assert temp_workbook_path.read_bytes() == b"existing"
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 """
 Comprehensive tests for column and row range selection with mixed data types.
 """
+import operator
 import pytest
 from pathlib import Path
 from libxlsx import load_workbook, formula
@@ -51,6 +52,24 @@ class TestColumnRangeSelection:
             # Each column should have at least some data
             assert len(col) > 0
     
+    def test_columns_are_cached(self, rich_workbook):
+        """Test that single and range access reuse the same column objects."""
+        sheet = rich_workbook["Sheet1"]
+        
+        col_a = sheet[A]
+        assert sheet[A] is col_a
+        assert next(sheet[A:C]) is col_a
+        assert [col.column for col in sheet["Y":"AB"]] == ["Y", "Z", "AA", "AB"]
+    
+    def test_range_iterators_report_length(self, rich_workbook):
+        """Test that range iterators tell list() their exact length up front."""
+        sheet = rich_workbook["Sheet1"]
+        
+        assert operator.length_hint(sheet[A:C]) == 3
+        assert operator.length_hint(sheet[A][1:4]) == 3
+        assert operator.length_hint(sheet[A][3:]) == 3
+        assert operator.length_hint(iter(sheet[A])) == len(sheet[A])
+    
     def test_column_range_iteration_mixed_data(self, rich_workbook):
         """Test iterating over column ranges with mixed data types."""
         sheet = rich_workbook["Sheet1"]
@@ -202,6 +221,102 @@ class TestRowRangeSelection:
         assert "Row15" in explicit_range
         print(f"Explicit range (10:16) found {len(explicit_range)} values")
 
+    
+    def test_bulk_column_values(self, rich_workbook):
+        """Test reading row ranges and whole columns as lists."""
+        sheet = rich_workbook["Sheet1"]
+        col_a = sheet[A]
+        
+        assert col_a.values(1, 4) == list(col_a[1:4])
+        assert col_a.values(4, 7) == [4.7, 5, None]
+        assert col_a.values(3) == [3, 4.7, 5]
+        assert col_a.to_list() == list(col_a)
+        assert col_a.to_list()[-1] == "Row15"
+
+    
+    def test_open_ended_stops_at_gap(self, rich_workbook):
+        """Test that open-ended ranges stop at the first missing row after edits."""
+        sheet = rich_workbook["Sheet1"]
+        col_g = sheet["G"]
+        
+        for row in [3, 4, 5, 7, 8]:
+            col_g[row] = row * 10
+        assert col_g.values(3) == [30, 40, 50]
+        assert col_g.values(7) == [70, 80]
+        assert col_g.values(6) == []
+        assert len(col_g) == 5
+        
+        col_g[6] = 60
+        assert list(col_g[3:]) == [30, 40, 50, 60, 70, 80]
+    
+    def test_column_to_numpy(self, rich_workbook):
+        """Test NumPy export for numeric columns and refusal for mixed ones."""
+        np = pytest.importorskip("numpy")
+        sheet = rich_workbook["Sheet1"]
+        
+        numbers = sheet["H"]
+        numbers.update({1: 1, 2: 2, 4: 4})
+        ints = numbers.to_numpy()
+        assert ints.dtype == np.int64
+        assert ints.tolist() == [1, 2, 4]
+        
+        numbers[3] = 2.5
+        floats = numbers.to_numpy()
+        assert floats.dtype == np.float64
+        assert floats.tolist() == [1.0, 2.0, 2.5, 4.0]
+        
+        numbers[5] = True
+        assert numbers.to_numpy() is None
+        assert sheet[B].to_numpy() is None
+        assert sheet["Z"].to_numpy().tolist() == []
+    
+    def test_rows_of_type(self, rich_workbook):
+        """Test finding rows by exact value type."""
+        sheet = rich_workbook["Sheet1"]
+        col_c = sheet[C]
+        
+        assert col_c.rows_of_type(formula) == [4, 5, 10]
+        assert col_c.rows_of_type(float) == [2]
+        assert col_c.rows_of_type(str) == []
+        
+        # Overwriting a cell updates its type
+        col_c[2] = "Now a string"
+        col_c[20] = True
+        assert col_c.rows_of_type(float) == []
+        assert col_c.rows_of_type(str) == [2]
+        assert col_c.rows_of_type(bool) == [20]
+
+    
+    def test_strings_are_interned(self, rich_workbook):
+        """Test that shared strings decode to a single object per entry."""
+        sheet = rich_workbook["Sheet1"]
+        shared_strings = rich_workbook.get_shared_strings()
+        
+        assert sheet[B][2] == "Beta"
+        assert shared_strings[shared_strings.index("Beta")] is sheet[B][2]
+        assert shared_strings[-1] is shared_strings[len(shared_strings) - 1]
+        
+        # Slices decode every entry they cover, like the list they replace
+        assert shared_strings[0:3] == [shared_strings[i] for i in range(3)]
+        assert shared_strings[::-1] == list(reversed(shared_strings))
+        assert None not in shared_strings[:]
+
+    
+    def test_get_block_and_many(self, rich_workbook):
+        """Test reading a rectangular range and scattered cells in one call."""
+        sheet = rich_workbook["Sheet1"]
+        
+        block = sheet.get_block((B, E), (1, 4))
+        assert block == [list(col[1:4]) for col in sheet[B:E]]
+        assert block[0][0] == "Alpha"
+        assert block[2][0] is True
+        assert sheet.get_block((A, A), (3, 3)) == [[]]
+        
+        assert sheet.get_many([(B, 1), (C, 1), (A, 100)]) == ["Alpha", 10, None]
+        
+        with pytest.raises(ValueError):
+            sheet.get_block((A, B), (0, 3))
+
 
 class TestRangeCombinations:
     """Test combinations of column and row ranges."""
@@ -300,6 +415,22 @@ class TestRangeCombinations:
         print(f"  Booleans ({len(bools)}): {bools}")
         print(f"  Formulas ({len(formulas)}): {formulas}")
     
+    def test_partition_range_by_type(self, rich_workbook):
+        """Test that one-pass partitioning matches filtering by exact type."""
+        sheet = rich_workbook["Sheet1"]
+        
+        expected = {value_type: [] for value_type in (float, int, str, bool, formula)}
+        for col in sheet[A:F]:
+            for row, cell_value in enumerate(col[1:6], start=1):
+                if cell_value is not None:
+                    expected[type(cell_value)].append((f"{col.column}{row}", cell_value))
+        
+        assert sheet.partition_range((A, F), (1, 6)) == expected
+        assert all(expected.values())
+        
+        col_c = sheet[C]
+        assert col_c.partition_by_type()[formula] == [(row, col_c[row]) for row in col_c.rows_of_type(formula)]
+    
     def test_sparse_data_ranges(self, rich_workbook):
         """Test range selection with sparse data (gaps between values)."""
         sheet = rich_workbook["Sheet1"]
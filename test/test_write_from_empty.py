@@ -40,13 +40,13 @@ class TestWriteFromEmpty:
         assert empty_workbook is not None
         
         # Should have at least one sheet
-        sheet_names = list(empty_workbook._sheets.keys())
+        sheet_names = empty_workbook.sheet_names
         assert len(sheet_names) > 0
         print(f"Empty workbook sheets: {sheet_names}")
     
     def test_explore_empty_workbook(self, empty_workbook):
         """Explore the empty workbook structure."""
-        sheet_names = list(empty_workbook._sheets.keys())
+        sheet_names = empty_workbook.sheet_names
         first_sheet = empty_workbook[sheet_names[0]]
         
         print(f"\nEmpty sheet: {first_sheet.name}")
@@ -66,7 +66,7 @@ class TestWriteFromEmpty:
     
     def test_recreate_fixture_data(self, empty_workbook, output_path):
         """Test recreating the same data as in our original fixture."""
-        sheet_names = list(empty_workbook._sheets.keys())
+        sheet_names = empty_workbook.sheet_names
         sheet = empty_workbook[sheet_names[0]]
         
         # Write the same values as in our original fixture (Book1.xlsx)
@@ -91,7 +91,7 @@ class TestWriteFromEmpty:
     def test_verify_recreated_vs_original(self, empty_workbook, original_workbook, output_path):
         """Test that our recreated fixture matches the original."""
         # Write to empty workbook
-        empty_sheet_names = list(empty_workbook._sheets.keys())
+        empty_sheet_names = empty_workbook.sheet_names
         empty_sheet = empty_workbook[empty_sheet_names[0]]
         
         empty_sheet[A][1] = 123.45
@@ -103,10 +103,10 @@ class TestWriteFromEmpty:
         recreated_workbook = load_workbook(output_path)
         
         # Compare with original
-        original_sheet_names = list(original_workbook._sheets.keys())
+        original_sheet_names = original_workbook.sheet_names
         original_sheet = original_workbook[original_sheet_names[0]]
         
-        recreated_sheet_names = list(recreated_workbook._sheets.keys())
+        recreated_sheet_names = recreated_workbook.sheet_names
         recreated_sheet = recreated_workbook[recreated_sheet_names[0]]
         
         # Compare the key cell values
@@ -122,9 +122,24 @@ class TestWriteFromEmpty:
             # Values should match
             assert original_val == recreated_val, f"Mismatch at {col}{row}: {original_val} != {recreated_val}"
     
+    def test_round_trip_in_memory(self, empty_workbook, original_workbook):
+        """Test that to_bytes output loads back with the edits, without a file."""
+        empty_sheet = empty_workbook[empty_workbook.sheet_names[0]]
+        empty_sheet.update({(A, 1): 123.45, (A, 2): "Hello world", (A, 3): formula("SUM(B2:B8)")})
+        
+        recreated_workbook = load_workbook(empty_workbook.to_bytes())
+        recreated_sheet = recreated_workbook[recreated_workbook.sheet_names[0]]
+        original_sheet = original_workbook[original_workbook.sheet_names[0]]
+        
+        test_cells = [(A, 1), (A, 2), (A, 3)]
+        assert recreated_sheet.get_many(test_cells) == original_sheet.get_many(test_cells)
+        
+        # Pending edits are still written by a later save
+        assert empty_sheet._dirty
+    
     def test_add_more_complex_data(self, empty_workbook):
         """Test adding more complex data types to validate our writing capabilities."""
-        sheet_names = list(empty_workbook._sheets.keys())
+        sheet_names = empty_workbook.sheet_names
         sheet = empty_workbook[sheet_names[0]]
         
         # Add various data types across multiple columns
@@ -144,6 +159,7 @@ class TestWriteFromEmpty:
         
         # Save and reload to verify persistence  
         output_dir = Path(__file__).parent / "out"
+        output_dir.mkdir(exist_ok=True)
         complex_output_path = output_dir / "complex_data_test.xlsx"
         empty_workbook.save(complex_output_path)
         reloaded_workbook = load_workbook(complex_output_path)
@@ -165,9 +181,46 @@ class TestWriteFromEmpty:
         
         print("All complex data types persisted correctly!")
     
+    def test_batched_writes_match_single_writes(self, empty_workbook):
+        """Test that Sheet.update and Column.update write the same XML as per-cell writes."""
+        single_workbook = load_workbook(EMPTY_FIXTURE_PATH)
+        single_sheet = single_workbook[single_workbook.sheet_names[0]]
+        batch_sheet = empty_workbook[empty_workbook.sheet_names[0]]
+        
+        values = {(C, 2): 3.14159, (A, 1): 123.45, (B, 2): -100, (A, 2): "Hello world", (A, 3): formula("SUM(B2:B8)")}
+        for (col, row), value in values.items():
+            single_sheet[col][row] = value
+        batch_sheet.update(values)
+        
+        assert batch_sheet.get_many(values) == list(values.values())
+        assert batch_sheet.serialize() == single_sheet.serialize()
+        assert batch_sheet[A].rows_of_type(formula) == [3]
+        
+        # Overwrites and new rows mix within one batch
+        batch_sheet[A].update({2: True, 4: "Appended"})
+        assert batch_sheet[A].values(1) == [123.45, True, formula("SUM(B2:B8)"), "Appended"]
+        assert batch_sheet[A].rows_of_type(bool) == [2]
+        
+        with pytest.raises(ValueError):
+            batch_sheet.update({(A, 0): 1})
+    
+    def test_small_update_on_large_column(self, empty_workbook):
+        """Test that small batches into a large column keep rows and tags in order."""
+        sheet = empty_workbook[empty_workbook.sheet_names[0]]
+        sheet[B].update({row: row for row in range(2, 20002, 2)})
+        
+        # Interleave a few new rows and an overwrite into the existing ones
+        sheet[B].update({5: "five", 101: 1.5, 4: True})
+        assert sheet._col_rows[B][:5] == [2, 4, 5, 6, 8]
+        assert sheet[B].values(4, 7) == [True, "five", 6]
+        assert sheet[B].rows_of_type(str) == [5]
+        assert sheet[B].rows_of_type(float) == [101]
+        assert sheet[B].rows_of_type(bool) == [4]
+        assert len(sheet[B]) == 10002
+    
     def test_column_operations_on_empty_workbook(self, empty_workbook):
         """Test that column operations work on initially empty workbook."""
-        sheet_names = list(empty_workbook._sheets.keys())
+        sheet_names = empty_workbook.sheet_names
         sheet = empty_workbook[sheet_names[0]]
         
         # Add data to a column
@@ -0,0 +1,40 @@
+"""
+Tests for the stdlib XML backend that read paths use under PyPy.
+"""
+import xml.etree.ElementTree
+import pytest
+from pathlib import Path
+from libxlsx import load_workbook, _xml, workbook as workbook_module
+
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+
+def load_cells(path, read_only):
+    """Load every sheet of a workbook and return its cells by sheet name."""
+    with load_workbook(path, read_only=read_only) as workbook:
+        return {name: workbook[name]._cells for name in workbook.sheet_names}
+
+
+def use_stdlib_backend(monkeypatch):
+    """Switch the XML backend to xml.etree, as it is selected on PyPy."""
+    monkeypatch.setattr(_xml, "LXML", False)
+    monkeypatch.setattr(_xml, "etree", xml.etree.ElementTree)
+    monkeypatch.setattr(workbook_module, "etree", xml.etree.ElementTree)
+    
+    # Expressions compiled at import time are bound to the backend active then
+    namespaces = workbook_module.NAMESPACES
+    monkeypatch.setattr(workbook_module, "_XP_SHEETS", _xml.XPath('//w:sheet', namespaces=namespaces))
+    monkeypatch.setattr(workbook_module, "_XP_REL", _xml.XPath('//pkg:Relationship[@Id=$rel_id]', namespaces=namespaces))
+
+
+@pytest.mark.parametrize("fixture_name", ["Book1.xlsx", "Book2.xlsx"])
+@pytest.mark.parametrize("read_only", [True, False])
+def test_stdlib_backend_matches_lxml(fixture_name, read_only, monkeypatch):
+    """Test that the stdlib backend loads the same cells as lxml."""
+    path = FIXTURES_PATH / fixture_name
+    expected = load_cells(path, read_only)
+    assert any(expected.values())
+    
+    use_stdlib_backend(monkeypatch)
+    assert load_cells(path, read_only) == expected